@@ -1,7 +1,22 @@
 import os
+import time
+import pickle
+import hashlib
 import logging
+import argparse
+import threading
+import operator
+import functools
+import collections
+import urllib.parse
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+import yaml
+import orjson
+import xxhash
 from dotenv import load_dotenv
-from baserowapi import Baserow, Filter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from baserowapi import Baserow, Filter, Row
 
 # Set up logging
 logging.basicConfig(
@@ -10,21 +25,182 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Configuration file used when no CONFIG_TABLE_ID is set
+DEFAULT_CONFIG_FILE = "config.yml"
+
+# Maximum number of rows Baserow accepts in a single batch request
+BATCH_SIZE = 200
+
+# Maximum number of record linker configurations processed at the same time
+MAX_CONCURRENT_CONFIGS = 4
+
+# Maximum number of rows Baserow returns per page when listing rows
+PAGE_SIZE = 200
+
+# Location and lifetime (in seconds) of cached target table indexes
+INDEX_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "baserow_linker"
+)
+INDEX_CACHE_TTL = 3600
+
+# Part of the cache key; bump whenever the format of cached indexes changes
+INDEX_CACHE_VERSION = 2
+
+# Look up target rows with server-side filters instead of indexing the whole target
+# table when there are fewer distinct source values than 1/PUSHDOWN_RATIO of its rows
+PUSHDOWN_RATIO = 50
+
+# Number of match values combined into one filtered request
+PUSHDOWN_BATCH_SIZE = 10
+
+# Number of HTTP requests made through configured sessions, for reporting
+_http_request_count = 0
+_http_request_count_lock = threading.Lock()
+
+# Guards the per-run index cache shared by concurrently processed configurations
+_index_cache_lock = threading.Lock()
+
+# Fields every record linker configuration must provide
+_REQUIRED_FIELDS = frozenset(
+    [
+        "source_table_id",
+        "target_table_id",
+        "source_table_match_field",
+        "target_table_match_field",
+        "target_table_primary_key_field",
+        "source_table_reference_field",
+    ]
+)
+
 # Load environment variables from .env file
 def load_env_variables():
     load_dotenv()
     baserow_url = os.getenv("BASEROW_URL")
     baserow_api_token = os.getenv("BASEROW_API_TOKEN")
-    config_table_id = os.getenv("CONFIG_TABLE_ID")
 
     # Check if the environment variables were successfully loaded
-    if not baserow_url or not baserow_api_token or not config_table_id:
+    if not baserow_url or not baserow_api_token:
         logger.error("Environment variables not set in .env file.")
         raise ValueError("Environment variables not set in .env file.")
     else:
         logger.info("Environment variables loaded successfully.")
 
-    return baserow_url, baserow_api_token, config_table_id
+    return baserow_url, baserow_api_token
+
+
+# Determine where the record linker configurations are loaded from
+def get_config_source():
+    """
+    Returns the configuration source for this run.
+
+    The CONFIG_TABLE_ID environment variable takes precedence; otherwise the
+    CONFIG_FILE environment variable, defaulting to config.yml, is used if it exists.
+
+    :return: A ``(kind, value)`` tuple: ``("table", config_table_id)`` or ``("file", config_file)``.
+    :rtype: tuple
+    :raises ValueError: If neither a config table ID nor a configuration file is available.
+    """
+    config_table_id = os.getenv("CONFIG_TABLE_ID")
+    if config_table_id:
+        return "table", config_table_id
+
+    config_file = os.getenv("CONFIG_FILE", DEFAULT_CONFIG_FILE)
+    if os.path.isfile(config_file):
+        return "file", config_file
+
+    logger.error("Neither CONFIG_TABLE_ID nor a configuration file is available.")
+    raise ValueError(
+        f"Set CONFIG_TABLE_ID in the .env file or provide a configuration file at {config_file}."
+    )
+
+
+# Load record linker configurations from a config table or a YAML file
+def load_record_linkers(baserow_client, source):
+    """
+    Loads record linker configurations from the given source.
+
+    :param baserow_client: The Baserow client object.
+    :param source: A ``(kind, value)`` tuple as returned by get_config_source: ``("table", config_table_id)``
+                   or ``("file", config_file)``.
+    :return: A list of record link configurations.
+    :raises ValueError: If the source kind is not recognized.
+    """
+    kind, value = source
+    if kind == "table":
+        return get_record_link_configs(baserow_client, value)
+    if kind == "file":
+        return get_record_link_configs_from_file(baserow_client, value)
+    raise ValueError(f"Unknown configuration source kind: {kind!r}")
+
+
+# Configure the Baserow client's HTTP session for the run
+def configure_session(baserow_client):
+    """
+    Mounts a pooled, retrying HTTP adapter on the Baserow client's session.
+
+    The client sends every request through one requests.Session; the adapter sizes its
+    connection pool for the concurrent fetches and retries transient server errors
+    with exponential backoff. Response bodies are parsed with orjson.
+
+    :param baserow_client: The Baserow client object.
+    :return: The configured session.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry)
+    baserow_client.session.mount("https://", adapter)
+    baserow_client.session.mount("http://", adapter)
+    baserow_client.session.hooks["response"].append(_use_orjson)
+    baserow_client.session.hooks["response"].append(_count_http_request)
+    return baserow_client.session
+
+
+# Count every response received by a configured session
+def _count_http_request(response, *args, **kwargs):
+    global _http_request_count
+    with _http_request_count_lock:
+        _http_request_count += 1
+    return response
+
+
+# Get the number of HTTP requests made through configured sessions during this run
+def get_http_request_count():
+    """
+    Returns the number of HTTP responses received through sessions set up by configure_session.
+
+    Retries performed inside the HTTP adapter are not counted separately.
+
+    :return: The number of HTTP requests made so far.
+    :rtype: int
+    """
+    with _http_request_count_lock:
+        return _http_request_count
+
+
+# Parse a response body with orjson instead of the standard library json module
+def _use_orjson(response, *args, **kwargs):
+    response.json = lambda **json_kwargs: orjson.loads(response.content)
+    return response
+
+
+# Get a Baserow table instance, reusing it for the rest of the run
+@functools.lru_cache(maxsize=None)
+def get_table_cached(baserow_client, table_id):
+    """
+    Retrieves a table instance from the Baserow client, memoized per client and table ID.
+
+    Reusing the same table instance means its field metadata is fetched from the API
+    only once per run, no matter how many configurations reference the table.
+
+    :param baserow_client: The Baserow client object.
+    :param table_id: The ID of the Baserow table.
+    :return: The table instance.
+    """
+    return baserow_client.get_table(table_id)
 
 
 # Get record link configurations from the config table
@@ -38,7 +214,7 @@ def get_record_link_configs(baserow_client, config_table_id):
     """
     try:
         # Retrieve the table instance
-        config_table = baserow_client.get_table(config_table_id)
+        config_table = get_table_cached(baserow_client, config_table_id)
 
         # Define a filter to get only active configurations
         active_filter = Filter("Active", 'True', "boolean")
@@ -67,70 +243,361 @@ def get_record_link_configs(baserow_client, config_table_id):
         raise
 
 
+# Get record link configurations from a YAML file
+def get_record_link_configs_from_file(baserow_client, config_file):
+    """
+    Reads record link configurations from a YAML file.
+
+    The file holds a ``record_linkers`` list whose entries use the same keys as the
+    configuration dictionaries. ``target_table_primary_key_field`` is looked up from
+    Baserow when omitted, and entries with ``active: false`` are skipped.
+
+    :param baserow_client: The Baserow client object.
+    :param config_file: The path to the YAML configuration file.
+    :return: A list of record link configurations.
+    :raises ValueError: If the file does not have the expected structure.
+    """
+    try:
+        with open(config_file, "r") as file:
+            data = yaml.safe_load(file) or {}
+
+        if not isinstance(data, dict):
+            raise ValueError(f"{config_file} must contain a mapping with a 'record_linkers' list.")
+
+        entries = data.get("record_linkers") or []
+        if not isinstance(entries, list):
+            raise ValueError(f"'record_linkers' in {config_file} must be a list.")
+
+        record_link_configs = []
+        for position, entry in enumerate(entries, start=1):
+            if not isinstance(entry, dict):
+                raise ValueError(f"Entry {position} of 'record_linkers' in {config_file} must be a mapping.")
+
+            if not entry.get("active", True):
+                continue
+
+            config = {key: value for key, value in entry.items() if key != "active"}
+            if "target_table_primary_key_field" not in config and "target_table_id" in config:
+                config["target_table_primary_key_field"] = get_primary_key_field(
+                    baserow_client, config["target_table_id"]
+                )
+            record_link_configs.append(config)
+
+        logger.info(f"Loaded {len(record_link_configs)} record link configurations from {config_file}.")
+        return record_link_configs
+
+    except Exception as e:
+        logger.error(f"Failed to load record link configurations: {e}")
+        raise
+
+
+# Clean match field values so source and target values compare equal
+def clean_match_values(values):
+    """
+    Trims and lower-cases a sequence of match field values.
+
+    The builtin string methods are mapped over the whole sequence, so no Python-level
+    loop body runs per value.
+
+    :param values: An iterable of match field values.
+    :return: An iterator over the cleaned values, in the same order.
+    """
+    return map(str.lower, map(str.strip, values))
+
+
+# Iterate over all rows of a Baserow table while the next pages are being fetched
+def iter_rows_prefetched(table, page_size=PAGE_SIZE, prefetch=2, include=None):
+    """
+    Yields the rows of a table page by page, requesting upcoming pages in the background.
+
+    The first page gives the total row count, after which up to ``prefetch`` further pages
+    are kept in flight on worker threads while the caller processes the current page.
+
+    :param table: The Baserow table instance.
+    :param page_size: The number of rows per page.
+    :param prefetch: The number of pages requested ahead of the page being processed.
+    :param include: A list of field names to include in the results, or None for all fields.
+    :return: A generator of Row objects in table order.
+    """
+    query = {"user_field_names": "true", "size": page_size}
+    if include:
+        query["include"] = ",".join(include)
+    endpoint = f"/api/database/rows/table/{table.id}/?{urllib.parse.urlencode(query, quote_via=urllib.parse.quote)}"
+
+    def fetch_page(page):
+        return table.client.make_api_request(f"{endpoint}&page={page}")
+
+    response = fetch_page(1)
+    page_count = -(-response["count"] // page_size)
+
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = collections.deque()
+        next_page = 2
+
+        while True:
+            # Keep the prefetch window full before handing the current page to the caller
+            while next_page <= page_count and len(pending) < prefetch:
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+
+            for row_data in response["results"]:
+                yield Row(row_data=row_data, table=table, client=table.client)
+
+            if not pending:
+                break
+            response = pending.popleft().result()
+
+
+# Turn cleaned match values into the integer keys used by the index
+def hash_match_values(values):
+    """
+    Hashes cleaned match values to 64-bit integers with xxh3.
+
+    Indexes are keyed by these integers rather than by the strings themselves, which
+    keeps large indexes small and makes each lookup an integer comparison.
+
+    :param values: An iterable of cleaned match values.
+    :return: An iterator over the match keys, in the same order.
+    """
+    return map(xxhash.xxh3_64_intdigest, values)
+
+
 # Create an index from a Baserow table based on a specified field
-def create_index_from_table(baserow_client, table_id, field_name):
+def create_index_from_table(baserow_client, table_id, field_name, primary_key_field):
     """
     Creates an index from a table based on a specified field, with logging and error handling.
 
+    Only the indexed field and the primary key field are requested from Baserow.
+
     :param baserow_client: The Baserow client object.
     :param table_id: The ID of the Baserow table.
     :param field_name: The name of the field to be used for indexing.
-    :return: A dictionary representing the index where the key is the cleaned field value.
+    :param primary_key_field: The name of the table's primary key field.
+    :return: A dictionary mapping the match key of the cleaned field value to the row's primary key value.
     """
 
     logger = logging.getLogger(__name__)
 
     try:
         # Retrieve the table instance
-        table = baserow_client.get_table(table_id)
+        table = get_table_cached(baserow_client, table_id)
     except Exception as e:
         logger.error(f"Failed to retrieve table with ID {table_id}. Error: {e}")
         raise
 
     try:
-        # Fetch all rows from the table
-        rows = table.get_rows()
+        # Stream all rows from the table, limited to the fields the index needs. Pages are
+        # fetched while the rows are consumed, so fetch errors surface during indexing.
+        rows = iter_rows_prefetched(table, include=[field_name, primary_key_field])
+        index = build_index_from_rows(rows, field_name, primary_key_field)
     except Exception as e:
-        logger.error(f"Failed to retrieve rows for table ID {table_id}. Error: {e}")
+        logger.error(f"Failed to retrieve or index rows for table ID {table_id}. Error: {e}")
         raise
 
-    index = {}
+    logger.info(f"Index creation completed for table ID: {table_id}")
+    return index
+
+
+# Build an index from rows that have already been fetched
+def build_index_from_rows(rows, field_name, primary_key_field):
+    """
+    Builds an index mapping cleaned field values to primary key values from an iterable of rows.
+
+    :param rows: An iterable of Baserow rows containing the indexed and primary key fields.
+    :param field_name: The name of the field to be used for indexing.
+    :param primary_key_field: The name of the table's primary key field.
+    :return: A dictionary mapping the match key of the cleaned field value to the row's primary key value.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    field_values = []
+    primary_keys = []
+    missing_count = 0
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    get_field_and_primary_key = operator.itemgetter(field_name, primary_key_field)
 
     for row in rows:
         try:
-            # Get the field value for the specified field name
-            field_value = row[field_name]
+            # Get the field value for the specified field name and the row's primary key
+            field_value, primary_key = get_field_and_primary_key(row)
 
             if field_value:
-                # Clean the field value: trim and convert to lower case
-                clean_value = field_value.strip().lower()
-
                 # Log the processed field value
-                logger.debug(
-                    f"Processed field '{field_name}' value: '{clean_value}' from row: {row.id}"
-                )
-
-                # Add the cleaned value to the index (using the row ID or the full row as value)
-                if clean_value in index:
-                    logger.warning(
-                        f"Duplicate index key found for value '{clean_value}' in row {row.id}"
+                if debug_enabled:
+                    logger.debug(
+                        f"Processed field '{field_name}' value: '{field_value}' from row: {row.id}"
                     )
-                index[clean_value] = row
+
+                # Collect the value and its primary key; cleaning happens for all rows at once
+                field_values.append(field_value)
+                primary_keys.append(primary_key)
             else:
-                logger.warning(f"Missing field '{field_name}' in row {row.id}")
+                missing_count += 1
+                if debug_enabled:
+                    logger.debug(f"Missing field '{field_name}' in row {row.id}")
 
         except KeyError:
-            logger.error(f"Field '{field_name}' not found in row {row.id}")
+            logger.error(f"Field '{field_name}' or '{primary_key_field}' not found in row {row.id}")
             continue  # Skip this row and move to the next one
         except Exception as e:
             logger.error(f"Unexpected error processing row {row.id}. Error: {e}")
             raise
 
-    logger.info(f"Index creation completed for table ID: {table_id}")
+    # Add the cleaned values to the index (using the primary key value as value)
+    clean_values = list(clean_match_values(field_values))
+    index = dict(zip(hash_match_values(clean_values), primary_keys))
+
+    # Later rows win on duplicate keys, so only count duplicates when some were dropped
+    if len(index) < len(clean_values):
+        for clean_value, count in collections.Counter(clean_values).items():
+            if count > 1:
+                logger.warning(
+                    f"Duplicate index key found for value '{clean_value}' in {count} rows"
+                )
+
+    if missing_count:
+        logger.warning(f"Missing field '{field_name}' in {missing_count} rows")
+
+    return index
+
+
+# Create an index containing only the target rows that can match the given values
+def create_filtered_index_from_table(baserow_client, table_id, field_name, primary_key_field, match_values, executor):
+    """
+    Creates an index for a set of match values by filtering the table on the server.
+
+    The values are sent in batches of PUSHDOWN_BATCH_SIZE as OR-ed "contains" filters, which
+    Baserow evaluates case-insensitively. Rows returned by a substring match that do not
+    equal one of the values after cleaning are dropped from the index, and rows returned by
+    more than one batch are indexed once.
+
+    :param baserow_client: The Baserow client object.
+    :param table_id: The ID of the Baserow table.
+    :param field_name: The name of the field to be used for indexing.
+    :param primary_key_field: The name of the table's primary key field.
+    :param match_values: A set of cleaned, non-empty values to look up.
+    :param executor: The executor used to run the filtered requests concurrently.
+    :return: A dictionary mapping the match key of the cleaned field value to the row's primary key value.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    table = get_table_cached(baserow_client, table_id)
+
+    def fetch_batch(batch):
+        filters = [Filter(field_name, value, "contains") for value in batch]
+        return table.get_rows(
+            include=[field_name, primary_key_field],
+            filter_type="OR",
+            filters=filters,
+            size=PAGE_SIZE,
+        )
+
+    sorted_values = sorted(match_values)
+    futures = [
+        executor.submit(fetch_batch, sorted_values[start : start + PUSHDOWN_BATCH_SIZE])
+        for start in range(0, len(sorted_values), PUSHDOWN_BATCH_SIZE)
+    ]
+    # A substring match can return the same row for several values in different
+    # batches; keep each row once so it is not reported as a duplicate index key
+    rows = {row.id: row for future in futures for row in future.result()}.values()
+
+    index = build_index_from_rows(rows, field_name, primary_key_field)
+    match_keys = set(hash_match_values(match_values))
+    index = {key: pk for key, pk in index.items() if key in match_keys}
+
+    logger.info(
+        f"Filtered index creation completed for table ID: {table_id} "
+        f"({len(index)} of {len(match_values)} values found)"
+    )
+    return index
+
+
+# Get the number of rows in a Baserow table
+def get_table_row_count(baserow_client: Baserow, table_id: int):
+    """
+    Retrieves the number of rows in a Baserow table with a single one-row request.
+
+    :param baserow_client: An instance of the Baserow client to interact with the API.
+    :type baserow_client: Baserow
+    :param table_id: The ID of the table.
+    :type table_id: int
+    :return: The number of rows in the table.
+    :rtype: int
+    """
+    response = baserow_client.make_api_request(
+        f"/api/database/rows/table/{table_id}/?user_field_names=true&size=1"
+    )
+    return response["count"]
+
+
+# Build the target table index or load it from the on-disk cache
+def build_or_load_index(baserow_client: Baserow, table_id: int, field_name: str, primary_key_field: str, use_cache: bool = False, row_count: int = None):
+    """
+    Returns the index for a table, reusing a cached copy from a previous run when possible.
+
+    Baserow does not expose a last-modified timestamp for tables to database tokens, so
+    the cache key combines the table ID, the indexed fields and the table's current row
+    count, and cached indexes expire after INDEX_CACHE_TTL seconds to pick up edited rows.
+    An edit that keeps the row count unchanged is missed until then, which is why the
+    cache is only used when explicitly enabled.
+
+    :param baserow_client: An instance of the Baserow client to interact with the API.
+    :type baserow_client: Baserow
+    :param table_id: The ID of the table to index.
+    :type table_id: int
+    :param field_name: The name of the field to be used for indexing.
+    :type field_name: str
+    :param primary_key_field: The name of the table's primary key field.
+    :type primary_key_field: str
+    :param use_cache: If False (the default), the index is always rebuilt and the cache is not written.
+    :type use_cache: bool
+    :param row_count: The table's row count, if already known. Fetched when needed otherwise.
+    :type row_count: int, optional
+    :return: A dictionary mapping the match key of the cleaned field value to the row's primary key value.
+    :rtype: dict
+    """
+    if not use_cache:
+        return create_index_from_table(baserow_client, table_id, field_name, primary_key_field)
+
+    if row_count is None:
+        row_count = get_table_row_count(baserow_client, table_id)
+    cache_key = hashlib.sha256(
+        repr(
+            (INDEX_CACHE_VERSION, baserow_client.url, str(table_id), field_name, primary_key_field, row_count)
+        ).encode()
+    ).hexdigest()
+    cache_path = os.path.join(INDEX_CACHE_DIR, f"{cache_key}.pickle")
+
+    try:
+        if time.time() - os.path.getmtime(cache_path) < INDEX_CACHE_TTL:
+            with open(cache_path, "rb") as cache_file:
+                index = pickle.load(cache_file)
+            logger.info(f"Loaded cached index for table ID: {table_id}")
+            return index
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to read cached index for table ID {table_id}. Error: {e}")
+
+    index = create_index_from_table(baserow_client, table_id, field_name, primary_key_field)
+
+    try:
+        os.makedirs(INDEX_CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so a concurrent reader never sees a partial file
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as cache_file:
+            pickle.dump(index, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Failed to write cached index for table ID {table_id}. Error: {e}")
+
     return index
 
 
 # Get the primary key field name for a specified Baserow table
+@functools.lru_cache(maxsize=None)
 def get_primary_key_field(baserow_client, table_id):
     """
     Retrieve the primary key field name for a specified Baserow table.
@@ -145,7 +612,7 @@ def get_primary_key_field(baserow_client, table_id):
     """
 
     try:
-        table = baserow_client.get_table(table_id)
+        table = get_table_cached(baserow_client, table_id)
         primary_key_field = table.primary_field
         logger.info(
             f"Retrieved primary key field: '{primary_key_field}' for table ID {table_id}."
@@ -164,15 +631,16 @@ def filter_baserow_table(baserow_client: Baserow, table_id: int, baserow_filters
     """
     Filters rows from a Baserow table based on a provided filter object.
 
+    This collects the rows yielded by filter_baserow_table_iter into a list.
+
     :param baserow_client: An instance of the Baserow client to interact with the API.
     :type baserow_client: Baserow
     :param table_id: The ID of the table to filter.
     :type table_id: int
-    :param baserow_filter: The filter object used to filter rows.
-                          It should follow the Baserow API filter structure.
-    :type baserow_filter: dict
-    :return: A list of filtered rows if successful, None otherwise.
-    :rtype: list | None
+    :param baserow_filters: A list of Filter objects used to filter rows.
+    :type baserow_filters: list
+    :return: A list of filtered rows, empty if no rows matched.
+    :rtype: list
 
     :raises ValueError: If the table_id is not valid or filter format is incorrect.
     :raises Exception: For other generic errors.
@@ -181,27 +649,12 @@ def filter_baserow_table(baserow_client: Baserow, table_id: int, baserow_filters
 
     >>> baserow_client = Baserow(api_token="your_api_token")
     >>> table_id = 123
-    >>> filter = {"field_name": "value"}
-    >>> rows = filter_baserow_table(baserow_client, table_id, filter)
+    >>> filters = [Filter("field_name", "value", "equal")]
+    >>> rows = filter_baserow_table(baserow_client, table_id, filters)
     """
     try:
-        # Retrieve table object
-        table = baserow_client.get_table(table_id)
-
-        if table is None:
-            raise ValueError(f"Table with ID {table_id} not found.")
-
-        # Apply the filter and fetch rows
-        filtered_rows = table.get_rows(
-            filters=baserow_filters
-        )
-
-        if filtered_rows:
-            logging.info("Successfully retrieved %d filtered rows.", len(filtered_rows))
-            return filtered_rows
-        else:
-            logging.warning("No rows matched the filter criteria.")
-            return []
+        # Collect the streamed rows; filter_baserow_table_iter logs the row count
+        return list(filter_baserow_table_iter(baserow_client, table_id, baserow_filters))
 
     except ValueError as ve:
         logging.error("Value error occurred: %s", ve)
@@ -211,13 +664,293 @@ def filter_baserow_table(baserow_client: Baserow, table_id: int, baserow_filters
         raise
 
 
+# Stream filtered rows from a Baserow table
+def filter_baserow_table_iter(baserow_client: Baserow, table_id: int, baserow_filters: list):
+    """
+    Yields rows from a Baserow table matching the provided filters, one page at a time.
+
+    Unlike filter_baserow_table, rows are not collected into a list, so only the current
+    page is held in memory. The number of rows retrieved is logged once iteration ends.
+
+    :param baserow_client: An instance of the Baserow client to interact with the API.
+    :type baserow_client: Baserow
+    :param table_id: The ID of the table to filter.
+    :type table_id: int
+    :param baserow_filters: A list of Filter objects used to filter rows.
+    :type baserow_filters: list
+    :return: A generator of filtered rows.
+    :rtype: Generator[Row, None, None]
+    """
+    table = get_table_cached(baserow_client, table_id)
+
+    row_count = 0
+    for row in table.get_rows(filters=baserow_filters, size=PAGE_SIZE, iterator=True):
+        row_count += 1
+        yield row
+
+    if row_count:
+        logging.info("Successfully retrieved %d filtered rows.", row_count)
+    else:
+        logging.warning("No rows matched the filter criteria.")
+
+
+# Update rows in a Baserow table using the batch endpoint
+def update_rows_in_batches(baserow_client: Baserow, table_id: int, reference_field: str, pending_updates: list, write: bool = True):
+    """
+    Writes queued row updates to a Baserow table in batches of at most BATCH_SIZE rows.
+
+    A failing batch is logged and skipped so the remaining batches are still written.
+    When ``write`` is False, the batches are only logged and nothing is sent to Baserow.
+
+    :param baserow_client: An instance of the Baserow client to interact with the API.
+    :type baserow_client: Baserow
+    :param table_id: The ID of the table to update.
+    :type table_id: int
+    :param reference_field: The name of the reference field being updated.
+    :type reference_field: str
+    :param pending_updates: A list of dictionaries, each containing the row "id" and the new field values.
+    :type pending_updates: list
+    :param write: Whether to send the updates to Baserow.
+    :type write: bool
+    :return: The number of rows successfully updated.
+    :rtype: int
+    """
+    table = get_table_cached(baserow_client, table_id)
+
+    # Format values the same way Row.update() would before sending them to the API
+    field = table.fields[reference_field]
+    for update in pending_updates:
+        update[reference_field] = field.format_for_api(update[reference_field])
+
+    updated_count = 0
+    for start in range(0, len(pending_updates), BATCH_SIZE):
+        chunk = pending_updates[start : start + BATCH_SIZE]
+        if not write:
+            logging.info("[dry-run] would update %d rows in table %s", len(chunk), table_id)
+            continue
+        try:
+            table.update_rows(chunk, batch_size=BATCH_SIZE)
+            updated_count += len(chunk)
+        except Exception as e:
+            logging.error(
+                "Failed to update rows %d-%d in table %s: %s",
+                start + 1,
+                start + len(chunk),
+                table_id,
+                e,
+            )
+
+    if write:
+        logging.info("Updated %d of %d rows in table %s.", updated_count, len(pending_updates), table_id)
+    return updated_count
+
+
+# Validate all record linker configurations before any linking starts
+def _validate_configs(record_linker_configs):
+    """
+    Checks that every configuration contains all required fields.
+
+    :param record_linker_configs: A list of record linker configuration dictionaries.
+    :raises ValueError: Listing every configuration with missing fields.
+    """
+    errors = []
+    for position, record_linker_config in enumerate(record_linker_configs, start=1):
+        missing = _REQUIRED_FIELDS - record_linker_config.keys()
+        if missing:
+            errors.append(
+                f"config {position}: missing required config field(s): {', '.join(sorted(missing))}"
+            )
+
+    if errors:
+        raise ValueError("; ".join(errors))
+
+
+# Link related records for a single record linker configuration
+def link_records_for_config(baserow_client: Baserow, record_linker_config: dict, executor: ThreadPoolExecutor, use_cache: bool = False, index_cache: dict = None, write: bool = True):
+    """
+    Links related records between the source and target table of one configuration.
+
+    The source rows with empty reference fields and the target table's row count are
+    fetched concurrently on the given executor. When the source rows contain few distinct
+    match values compared to the size of the target table, only the target rows matching
+    those values are fetched; otherwise the whole target table is indexed, once per run
+    for all configurations sharing the same target table and fields.
+
+    :param baserow_client: An instance of the Baserow client to interact with the API.
+    :type baserow_client: Baserow
+    :param record_linker_config: A dictionary containing the configuration for linking records.
+    :type record_linker_config: dict
+    :param executor: The executor used to run the fetches for this configuration.
+    :type executor: ThreadPoolExecutor
+    :param use_cache: Whether the target table index may be loaded from the on-disk cache.
+    :type use_cache: bool
+    :param index_cache: Futures of whole-table indexes already requested during this run, keyed by
+                        (target_table_id, target_table_match_field, target_table_primary_key_field).
+    :type index_cache: dict, optional
+    :param write: Whether to send the reference field updates to Baserow.
+    :type write: bool
+    :return: None
+    :rtype: None
+    """
+    # Extract configuration details
+    source_table_id = record_linker_config["source_table_id"]
+    target_table_id = record_linker_config["target_table_id"]
+    source_table_match_field = record_linker_config["source_table_match_field"]
+    target_table_match_field = record_linker_config["target_table_match_field"]
+    target_table_primary_key_field = record_linker_config[
+        "target_table_primary_key_field"
+    ]
+    source_table_reference_field = record_linker_config[
+        "source_table_reference_field"
+    ]
+
+    logging.info(
+        "Linking records between source table %s and target table %s",
+        source_table_id,
+        target_table_id,
+    )
+
+    # Get rows from the source table with empty reference fields and the size of
+    # the target table at the same time
+    empty_reference_filter = Filter(source_table_reference_field, "", "empty")
+    get_match_field = operator.itemgetter(source_table_match_field)
+
+    def read_source_rows():
+        # Keep only the row ID and match value of each streamed row, not the row itself
+        source_row_ids = []
+        raw_match_values = []
+        for source_row in filter_baserow_table_iter(
+            baserow_client, source_table_id, [empty_reference_filter]
+        ):
+            source_row_ids.append(source_row.id)
+            raw_match_values.append(get_match_field(source_row))
+        return source_row_ids, list(clean_match_values(raw_match_values))
+
+    source_rows_future = executor.submit(read_source_rows)
+    target_row_count_future = executor.submit(
+        get_table_row_count, baserow_client, target_table_id
+    )
+
+    source_row_ids, match_field_values = source_rows_future.result()
+    target_row_count = target_row_count_future.result()
+
+    if not source_row_ids:
+        logging.warning(
+            "No rows with empty reference fields found in source table %s",
+            source_table_id,
+        )
+        return
+
+    distinct_match_values = set(match_field_values)
+    distinct_match_values.discard("")
+
+    if index_cache is None:
+        index_cache = {}
+    index_key = (target_table_id, target_table_match_field, target_table_primary_key_field)
+
+    # Create an index for the target table using the match field, either from the
+    # rows matching the source values or from the whole table. A whole-table index
+    # another configuration already requested is always reused.
+    if (
+        index_key not in index_cache
+        and len(distinct_match_values) < target_row_count / PUSHDOWN_RATIO
+    ):
+        logging.info(
+            "Looking up %d distinct values in target table %s with filtered requests",
+            len(distinct_match_values),
+            target_table_id,
+        )
+        target_table_index = create_filtered_index_from_table(
+            baserow_client,
+            target_table_id,
+            target_table_match_field,
+            target_table_primary_key_field,
+            distinct_match_values,
+            executor,
+        )
+    else:
+        with _index_cache_lock:
+            if index_key not in index_cache:
+                index_cache[index_key] = executor.submit(
+                    build_or_load_index,
+                    baserow_client,
+                    target_table_id,
+                    target_table_match_field,
+                    target_table_primary_key_field,
+                    use_cache,
+                    target_row_count,
+                )
+            target_index_future = index_cache[index_key]
+
+        target_table_index = target_index_future.result()
+
+    # Link related records
+    pending_updates = []
+    matched_count = 0
+    unmatched_count = 0
+    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+    match_keys = hash_match_values(match_field_values)
+    for source_row_id, match_field_value, match_key in zip(
+        source_row_ids, match_field_values, match_keys
+    ):
+        # A single dict probe covers both the match check and the lookup
+        target_primary_key = target_table_index.get(match_key)
+
+        if target_primary_key is not None:
+            # Queue the reference field update for the source row
+            pending_updates.append(
+                {
+                    "id": source_row_id,
+                    source_table_reference_field: target_primary_key,
+                }
+            )
+            matched_count += 1
+            if debug_enabled:
+                logging.debug(
+                    "Linked source row %s to target row '%s'",
+                    source_row_id,
+                    target_primary_key,
+                )
+        else:
+            unmatched_count += 1
+            if debug_enabled:
+                logging.debug(
+                    "No match found for source row %s (Match field: %s)",
+                    source_row_id,
+                    match_field_value,
+                )
+
+    logging.info(
+        "Source table %s -> target table %s: %d matched, %d unmatched of %d source rows",
+        source_table_id,
+        target_table_id,
+        matched_count,
+        unmatched_count,
+        len(source_row_ids),
+    )
+
+    # Updates are only sent once all source rows have been read: linked rows drop out of
+    # the empty-reference filter, which would shift the pages still being read
+    if pending_updates:
+        update_rows_in_batches(
+            baserow_client,
+            source_table_id,
+            source_table_reference_field,
+            pending_updates,
+            write,
+        )
+
+
 # Link related records between source and target tables
-def link_related_records(baserow_client: Baserow, record_linker_configs: list):
+def link_related_records(baserow_client: Baserow, record_linker_configs: list, use_cache: bool = False, write: bool = True):
     """
     Links related records between source and target tables based on provided configurations.
 
     This function matches rows between a source and a target table using a matching field
     and updates the reference field in the source table with the primary key of the target row.
+    Configurations that update the same reference field of the same source table run in
+    the given order; up to MAX_CONCURRENT_CONFIGS such groups are processed at the same time.
+    If any configuration fails, the ones that have not started yet are skipped.
 
     :param baserow_client: An instance of the Baserow client to interact with the API.
     :type baserow_client: Baserow
@@ -230,89 +963,85 @@ def link_related_records(baserow_client: Baserow, record_linker_configs: list):
                                   - "target_table_primary_key_field" (str): The primary key field name in the target table.
                                   - "source_table_reference_field" (str): The reference field in the source table to be updated.
     :type record_linker_configs: list
+    :param use_cache: Whether target table indexes may be loaded from the on-disk cache.
+    :type use_cache: bool
+    :param write: Whether to send the reference field updates to Baserow. If False, the
+                  updates that would be made are only logged.
+    :type write: bool
     :raises ValueError: If any required config fields are missing or invalid.
     :raises Exception: For any other unexpected errors during the linking process.
     :return: None
     :rtype: None
     """
     try:
+        # Reject the whole batch up front so a bad configuration cannot leave a partial run
+        _validate_configs(record_linker_configs)
+
+        # Whole-table indexes shared by configurations with the same target
+        index_cache = {}
+
+        # Configurations writing the same reference field of the same source table must
+        # run in order: a later one (e.g. a fallback match on another field) may only see
+        # the rows an earlier one left empty. Only separate groups run at the same time.
+        config_groups = {}
         for record_linker_config in record_linker_configs:
-            # Validate configuration fields
-            required_fields = [
-                "source_table_id",
-                "target_table_id",
-                "source_table_match_field",
-                "target_table_match_field",
-                "target_table_primary_key_field",
-                "source_table_reference_field",
-            ]
-
-            for field in required_fields:
-                if field not in record_linker_config:
-                    raise ValueError(f"Missing required config field: {field}")
-
-            # Extract configuration details
-            source_table_id = record_linker_config["source_table_id"]
-            target_table_id = record_linker_config["target_table_id"]
-            source_table_match_field = record_linker_config["source_table_match_field"]
-            target_table_match_field = record_linker_config["target_table_match_field"]
-            target_table_primary_key_field = record_linker_config[
-                "target_table_primary_key_field"
-            ]
-            source_table_reference_field = record_linker_config[
-                "source_table_reference_field"
-            ]
-
-            logging.info(
-                "Linking records between source table %s and target table %s",
-                source_table_id,
-                target_table_id,
+            group_key = (
+                str(record_linker_config["source_table_id"]),
+                record_linker_config["source_table_reference_field"],
             )
+            config_groups.setdefault(group_key, []).append(record_linker_config)
 
-            # Get rows from the source table with empty reference fields
-            empty_reference_filter = Filter(source_table_reference_field, "", "empty")
-            source_table_rows = filter_baserow_table(
-                baserow_client, source_table_id, [empty_reference_filter]
-            )
+        stop_event = threading.Event()
 
-            if not source_table_rows:
-                logging.warning(
-                    "No rows with empty reference fields found in source table %s",
-                    source_table_id,
+        def link_config_group(group_configs):
+            for record_linker_config in group_configs:
+                if stop_event.is_set():
+                    return
+                link_records_for_config(
+                    baserow_client,
+                    record_linker_config,
+                    fetch_executor,
+                    use_cache,
+                    index_cache,
+                    write,
                 )
-                continue
 
-            # Create an index for the target table using the match field
-            target_table_index = create_index_from_table(
-                baserow_client, target_table_id, target_table_match_field
-            )
+        # Each configuration runs two fetches at once, so the fetch pool is twice
+        # the size of the configuration pool to keep them from starving each other
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CONFIGS) as config_executor, \
+                ThreadPoolExecutor(max_workers=2 * MAX_CONCURRENT_CONFIGS) as fetch_executor:
+            futures = {
+                config_executor.submit(link_config_group, group_configs): group_key
+                for group_key, group_configs in config_groups.items()
+            }
 
-            # Link related records
-            for source_row in source_table_rows:
-                match_field_value = source_row[source_table_match_field].strip().lower()
+            # Once a group fails, skip groups and configurations that have not started yet
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            if any(future.exception() for future in done):
+                stop_event.set()
+                for future in not_done:
+                    future.cancel()
+            wait(futures)
 
-                if match_field_value in target_table_index:
-                    target_row = target_table_index[match_field_value]
+        errors = []
+        for future, (source_table_id, reference_field) in futures.items():
+            if future.cancelled():
+                logging.warning(
+                    "Skipped linking source table %s field '%s' after an earlier failure",
+                    source_table_id,
+                    reference_field,
+                )
+            elif future.exception():
+                logging.error(
+                    "Linking source table %s field '%s' failed: %s",
+                    source_table_id,
+                    reference_field,
+                    future.exception(),
+                )
+                errors.append(future.exception())
 
-                    # Update the reference field in the source row
-                    source_row.update(
-                        {
-                            source_table_reference_field: target_row[
-                                target_table_primary_key_field
-                            ]
-                        }
-                    )
-                    logging.info(
-                        "Linked source row %s to target row %s",
-                        source_row.id,
-                        target_row.id,
-                    )
-                else:
-                    logging.warning(
-                        "No match found for source row %s (Match field: %s)",
-                        source_row.id,
-                        match_field_value,
-                    )
+        if errors:
+            raise errors[0]
 
     except ValueError as ve:
         logging.error("Value error occurred: %s", ve)
@@ -323,18 +1052,38 @@ def link_related_records(baserow_client: Baserow, record_linker_configs: list):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Link related records between Baserow tables.")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse target table indexes cached on disk by a previous run (may be up to an hour stale).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Match records and log the updates that would be made without writing to Baserow.",
+    )
+    args = parser.parse_args()
+
     try:
         # Load environment variables
-        baserow_url, baserow_api_token, config_table_id = load_env_variables()
+        baserow_url, baserow_api_token = load_env_variables()
+        config_source = get_config_source()
+        dry_run = args.dry_run or os.getenv("DRY_RUN", "").lower() in ("1", "true", "yes")
 
         # Create a Baserow client
         baserow = Baserow(baserow_url, baserow_api_token)
+        configure_session(baserow)
 
         # Load record linkers configuration
-        record_linkers = get_record_link_configs(baserow, config_table_id)
+        record_linkers = load_record_linkers(baserow, config_source)
 
         # Link related records
-        link_related_records(baserow, record_linkers)
+        link_related_records(
+            baserow, record_linkers, use_cache=args.cache, write=not dry_run
+        )
+
+        logger.info(f"Made {get_http_request_count()} HTTP requests to Baserow.")
 
     except Exception as e:
         logger.critical(f"An unexpected error occurred: {e}")